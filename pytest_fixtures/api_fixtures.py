@@ -65,12 +65,11 @@ def module_lce(module_org):
 
 @pytest.fixture(scope='session')
 def default_smart_proxy():
-    smart_proxy = (
+    return (
         entities.SmartProxy()
         .search(query={'search': 'name={0}'.format(settings.server.hostname)})[0]
         .read()
     )
-    return entities.SmartProxy(id=smart_proxy.id).read()
 
 
 @pytest.fixture(scope='session')
@@ -78,8 +77,7 @@ def default_domain(default_smart_proxy):
     domain_name = settings.server.hostname.partition('.')[-1]
     dom = entities.Domain().search(query={'search': 'name={}'.format(domain_name)})[0]
     dom.dns = default_smart_proxy
-    dom.update(['dns'])
-    return entities.Domain(id=dom.id).read()
+    return dom.update(['dns'])
 
 
 @pytest.fixture(scope='module')
@@ -120,9 +118,7 @@ def module_provisioningtemplate_default(module_org, module_location):
     provisioning_template = provisioning_template[0].read()
     provisioning_template.organization.append(module_org)
     provisioning_template.location.append(module_location)
-    provisioning_template.update(['organization', 'location'])
-    provisioning_template = entities.ProvisioningTemplate(id=provisioning_template.id).read()
-    return provisioning_template
+    return provisioning_template.update(['organization', 'location'])
 
 
 @pytest.fixture(scope='module')
@@ -133,9 +129,7 @@ def module_provisioningtemplate_pxe(module_org, module_location):
     pxe_template = pxe_template[0].read()
     pxe_template.organization.append(module_org)
     pxe_template.location.append(module_location)
-    pxe_template.update(['organization', 'location'])
-    pxe_template = entities.ProvisioningTemplate(id=pxe_template.id).read()
-    return pxe_template
+    return pxe_template.update(['organization', 'location'])
 
 
 @pytest.fixture(scope='session')
@@ -182,9 +176,7 @@ def default_os(
     os.architecture.append(default_architecture)
     os.ptable.append(default_partitiontable)
     os.provisioning_template.append(default_pxetemplate)
-    os.update(['architecture', 'ptable', 'provisioning_template'])
-    os = entities.OperatingSystem(id=os.id).read()
-    return os
+    return os.update(['architecture', 'ptable', 'provisioning_template'])
 
 
 @pytest.fixture(scope='session')
@@ -198,10 +190,7 @@ def default_puppet_environment(module_org):
 
 @pytest.fixture(scope='module')
 def module_puppet_environment(module_org, module_location):
-    environment = entities.Environment(
-        organization=[module_org], location=[module_location]
-    ).create()
-    return entities.Environment(id=environment.id).read()
+    return entities.Environment(organization=[module_org], location=[module_location]).create()
 
 
 # Google Cloud Engine Entities
@@ -1,5 +1,9 @@
 """Module containing convenience functions for working with the API."""
+import functools
 import time
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 from fauxfactory import gen_ipaddr
 from fauxfactory import gen_mac
@@ -7,7 +11,6 @@ from fauxfactory import gen_string
 from inflector import Inflector
 from nailgun import entities
 from nailgun import entity_mixins
-from nailgun.client import request
 
 from robottelo import ssh
 from robottelo.config import settings
@@ -20,6 +23,11 @@ from robottelo.constants import REPO_TYPE
 from robottelo.constants import RHEL_6_MAJOR_VERSION
 from robottelo.constants import RHEL_7_MAJOR_VERSION
 from robottelo.constants.repos import FAKE_1_YUM_REPO
+from robottelo.helpers import get_http_session
+from robottelo.utils import json_loads
+
+# Products of each organization indexed by name, see ``get_product_index``
+_PRODUCT_INDEX = {}
 
 
 def call_entity_method_with_timeout(entity_callable, timeout=300, **kwargs):
@@ -41,6 +49,89 @@ def call_entity_method_with_timeout(entity_callable, timeout=300, **kwargs):
         entity_mixins.TASK_TIMEOUT = original_task_timeout
 
 
+def get_product_index(org_id, refresh=False):
+    """Return the products of an organization indexed by their names.
+
+    The index is built with a single search and cached per organization. A
+    product deleted and created again under the same name keeps its old id in
+    the index until it is refreshed, use ``refresh=True`` to rebuild it.
+
+    :param org_id: The organization Id.
+    :param bool refresh: Whether to rebuild the cached index.
+    :return: A dict mapping product names to ``nailgun.entities.Product``.
+    """
+    if refresh or org_id not in _PRODUCT_INDEX:
+        products = entities.Product(organization=org_id).search(query={'per_page': 10000})
+        _PRODUCT_INDEX[org_id] = {product.name: product for product in products}
+    return _PRODUCT_INDEX[org_id]
+
+
+def search_iter(entity, query=None, page_size=200):
+    """Search entities one page at a time.
+
+    Pages are only requested while the caller keeps iterating, so stopping the
+    iteration early avoids fetching the remaining results.
+
+    :param entity: The ``nailgun.entities`` object to search with, e.g.
+        ``entities.Permission()``.
+    :param dict query: The search query, without the pagination parameters.
+    :param int page_size: How many results to request per page.
+    :return: A generator of ``nailgun.entities`` objects.
+    """
+    query = dict(query or {}, per_page=page_size)
+    page = 1
+    while True:
+        results = entity.search(query=dict(query, page=page))
+        yield from results
+        if len(results) < page_size:
+            break
+        page += 1
+
+
+def search_all(entity, query=None, page_size=200, max_workers=4):
+    """Search all the entities, fetching several pages concurrently.
+
+    Unlike :func:`search_iter` all the results are fetched, ``max_workers``
+    pages at a time, so at most ``max_workers - 1`` pages past the last one are
+    requested for nothing.
+
+    :param entity: The ``nailgun.entities`` object to search with, e.g.
+        ``entities.Permission()``.
+    :param dict query: The search query, without the pagination parameters.
+    :param int page_size: How many results to request per page.
+    :param int max_workers: How many pages to request at the same time.
+    :return: A list of ``nailgun.entities`` objects.
+    """
+    query = dict(query or {}, per_page=page_size)
+    results = []
+    first_page = 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            pages = executor.map(
+                lambda page: entity.search(query=dict(query, page=page)),
+                range(first_page, first_page + max_workers),
+            )
+            for page_results in pages:
+                results.extend(page_results)
+                if len(page_results) < page_size:
+                    return results
+            first_page += max_workers
+
+
+@functools.lru_cache(maxsize=512)
+def get_repository_set(product_id, name):
+    """Return the repository set of a product with the given name.
+
+    The repository sets of a product do not change, so the result is cached,
+    use ``get_repository_set.cache_clear()`` if a product is removed.
+
+    :param product_id: The product Id.
+    :param str name: The repository set name.
+    :return: A ``nailgun.entities.RepositorySet``.
+    """
+    return entities.RepositorySet(name=name, product=product_id).search()[0]
+
+
 def enable_rhrepo_and_fetchid(basearch, org_id, product, repo, reposet, releasever):
     """Enable a RedHat Repository and fetches it's Id.
 
@@ -54,20 +145,95 @@ def enable_rhrepo_and_fetchid(basearch, org_id, product, repo, reposet, releasev
     :rtype: str
 
     """
-    product = entities.Product(name=product, organization=org_id).search()[0]
-    r_set = entities.RepositorySet(name=reposet, product=product).search()[0]
+    product, _ = _enable_reposet(org_id, product, reposet, basearch, releasever)
+    return _fetch_repo_id(org_id, product.id, repo)
+
+
+def enable_rhrepos_and_fetchids(org_id, rh_repos, poll_rate=None, timeout=None):
+    """Enable several RedHat Repositories at once and fetch their Ids.
+
+    All the enable requests are submitted without waiting and then the
+    resulting tasks are polled together with :func:`poll_tasks`.
+
+    :param str org_id: The organization Id.
+    :param rh_repos: Dictionaries with the ``product``, ``reposet`` and
+        ``name`` of each repository, and optionally its ``basearch`` and
+        ``releasever``, see :func:`enable_sync_redhat_repo`.
+    :param poll_rate: Passed to :func:`poll_tasks`.
+    :param timeout: Passed to :func:`poll_tasks`.
+    :return: A list with the Id of each repository, in the same order as
+        ``rh_repos``.
+    """
+    rh_repos = list(rh_repos)
+    enabled = [
+        _enable_reposet(
+            org_id,
+            rh_repo['product'],
+            rh_repo['reposet'],
+            rh_repo.get('basearch'),
+            rh_repo.get('releasever'),
+            synchronous=False,
+        )
+        for rh_repo in rh_repos
+    ]
+    poll_tasks(pluck_ids(task for _, task in enabled), poll_rate=poll_rate, timeout=timeout)
+    return [
+        _fetch_repo_id(org_id, product.id, rh_repo['name'])
+        for (product, _), rh_repo in zip(enabled, rh_repos)
+    ]
+
+
+def _get_product(org_id, product_name, refresh=False):
+    """Return the product with the given name from the organization index.
+
+    :raises: ``nailgun.entities.APIResponseError`` if the product is not in the
+        refreshed index either.
+    """
+    product = get_product_index(org_id, refresh=refresh).get(product_name)
+    if product is None and not refresh:
+        # the product may have been created after the index was built
+        product = get_product_index(org_id, refresh=True).get(product_name)
+    if product is None:
+        raise entities.APIResponseError(
+            'product "{}" not found in organization {}'.format(product_name, org_id)
+        )
+    return product
+
+
+def _enable_reposet(org_id, product_name, reposet, basearch, releasever, synchronous=True):
+    """Enable a repository of a RedHat repository set.
+
+    :return: A ``(product, result)`` tuple, where ``result`` is whatever
+        ``nailgun.entities.RepositorySet.enable`` returns.
+    """
+    product = _get_product(org_id, product_name)
+    try:
+        r_set = get_repository_set(product.id, reposet)
+    except IndexError:
+        # the indexed product may have been deleted and created again under
+        # the same name, look its id up once more before giving up
+        product = _get_product(org_id, product_name, refresh=True)
+        r_set = get_repository_set(product.id, reposet)
     payload = {}
     if basearch is not None:
         payload['basearch'] = basearch
     if releasever is not None:
         payload['releasever'] = releasever
     payload['product_id'] = product.id
-    r_set.enable(data=payload)
-    result = entities.Repository(name=repo).search(query={'organization_id': org_id})
-    return result[0].id
+    return product, r_set.enable(data=payload, synchronous=synchronous)
 
 
-def promote(content_view_version, environment_id, force=False):
+def _fetch_repo_id(org_id, product_id, name):
+    """Return the Id of the repository with the given name in a product."""
+    # the product is already known, narrow the search to it and to the single
+    # result that is used, only its id is needed so no entity is built
+    result = entities.Repository(name=name).search_json(
+        query={'organization_id': org_id, 'product_id': product_id, 'per_page': 1}
+    )
+    return result['results'][0]['id']
+
+
+def promote(content_view_version, environment_id, force=False, timeout=None):
     """Call ``content_view_version.promote(…)``.
 
     :param content_view_version: A ``nailgun.entities.ContentViewVersion``
@@ -76,23 +242,150 @@ def promote(content_view_version, environment_id, force=False):
     :param force: Whether to force the promotion or not. Only needed if
         promoting to a lifecycle environment that is not the next in order
         of sequence.
+    :param timeout: Maximum number of seconds to wait for the promotion task,
+        defaults to ``nailgun.entity_mixins.TASK_TIMEOUT``.
     :returns: Whatever ``nailgun.entities.ContentViewVersion.promote`` returns.
 
     """
     data = {'environment_ids': [environment_id], 'force': True if force else False}
-    return content_view_version.promote(data=data)
+    if timeout is None:
+        return content_view_version.promote(data=data)
+    # nailgun passes any extra keyword to the HTTP request, poll the task here
+    # to wait for it with the requested timeout
+    task = content_view_version.promote(data=data, synchronous=False)
+    return entities.ForemanTask(id=task['id']).poll(timeout=timeout)
+
+
+def bulk_read(entities_, max_workers=8):
+    """Read several entities concurrently.
 
+    The read requests are independent from each other, so they are sent from
+    a thread pool instead of one after the other.
 
-def upload_manifest(organization_id, manifest):
+    :param entities_: The ``nailgun`` entities to read.
+    :param max_workers: Maximum number of entities read at the same time.
+    :return: A list with the read entities, in the same order as
+        ``entities_``.
+    """
+    entities_ = list(entities_)
+    if not entities_:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(entities_))) as executor:
+        return list(executor.map(lambda entity: entity.read(), entities_))
+
+
+def pluck_ids(items, key='id'):
+    """Return the ids found in a list of dictionaries returned by the API.
+
+    :param items: An iterable of dictionaries, e.g. tasks or search results.
+    :param key: The name of the id field.
+    :return: A list with the ``key`` value of each item.
+    """
+    return list(map(itemgetter(key), items))
+
+
+def poll_tasks(task_ids, poll_rate=None, timeout=None, max_workers=8):
+    """Poll several foreman tasks concurrently until all of them finish.
+
+    :param task_ids: IDs of the ``nailgun.entities.ForemanTask`` to poll.
+    :param poll_rate: Delay between the end of one task check-up and the start
+        of the next check-up. Parameter for
+        ``nailgun.entities.ForemanTask.poll()`` method.
+    :param timeout: Maximum number of seconds to wait for each task.
+        Parameter for ``nailgun.entities.ForemanTask.poll()`` method.
+    :param max_workers: Maximum number of tasks polled at the same time.
+    :return: A list with the attributes of each finished task, in the same
+        order as ``task_ids``.
+    :raises: ``nailgun.entities.TaskFailedError`` or
+        ``nailgun.entities.TaskTimedOutError`` as soon as any of the tasks
+        fails, without waiting for the polls still running.
+    """
+    task_ids = list(task_ids)
+    if not task_ids:
+        return []
+
+    def _poll(task_id):
+        return entities.ForemanTask(id=task_id).poll(poll_rate=poll_rate, timeout=timeout)
+
+    # the executor is not used as a context manager, leaving the ``with`` block
+    # would wait for all the running polls before reporting a failure
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(task_ids)))
+    futures = {executor.submit(_poll, task_id): index for index, task_id in enumerate(task_ids)}
+    results = [None] * len(task_ids)
+    try:
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    except Exception:
+        # do not start polling the tasks that are still waiting, and do not
+        # wait for the polls already running
+        for pending in futures:
+            pending.cancel()
+        executor.shutdown(wait=False)
+        raise
+    executor.shutdown()
+    return results
+
+
+def submit_tasks(method_name, entities_, poll_rate=None, timeout=None):
+    """Call an asynchronous entity method on several entities at once.
+
+    The method is called with ``synchronous=False`` on each entity, so all the
+    requests are submitted without waiting, and then the resulting tasks are
+    polled together with :func:`poll_tasks`.
+
+    :param str method_name: The name of the entity method to call, e.g.
+        ``'publish'`` or ``'sync'``.
+    :param entities_: The ``nailgun`` entities to call the method on.
+    :param poll_rate: Passed to :func:`poll_tasks`.
+    :param timeout: Passed to :func:`poll_tasks`.
+    :return: A list with the attributes of each finished task.
+    """
+    tasks = [getattr(entity, method_name)(synchronous=False) for entity in entities_]
+    return poll_tasks(pluck_ids(tasks), poll_rate=poll_rate, timeout=timeout)
+
+
+def publish_content_views(content_views, poll_rate=None, timeout=None):
+    """Publish several content views at once.
+
+    See :func:`submit_tasks`.
+
+    :param content_views: ``nailgun.entities.ContentView`` objects to publish.
+    :param poll_rate: Passed to :func:`poll_tasks`.
+    :param timeout: Passed to :func:`poll_tasks`.
+    :return: A list with the attributes of each finished publish task.
+    """
+    return submit_tasks('publish', content_views, poll_rate=poll_rate, timeout=timeout)
+
+
+def sync_repositories(repositories, poll_rate=None, timeout=None):
+    """Synchronize several repositories at once.
+
+    The repositories are synchronized by the server in parallel, see
+    :func:`submit_tasks`.
+
+    :param repositories: ``nailgun.entities.Repository`` objects to sync.
+    :param poll_rate: Passed to :func:`poll_tasks`.
+    :param timeout: Passed to :func:`poll_tasks`.
+    :return: A list with the attributes of each finished sync task.
+    """
+    return submit_tasks('sync', repositories, poll_rate=poll_rate, timeout=timeout)
+
+
+def upload_manifest(organization_id, manifest, synchronous=True):
     """Call ``nailgun.entities.Subscription.upload``.
 
     :param organization_id: An organization ID.
     :param manifest: A file object referencing a Red Hat Satellite 6 manifest.
+    :param synchronous: Whether to wait for the upload task to finish. When
+        ``False`` the upload task is returned right away, so the ids of several
+        uploads can be polled together with :func:`poll_tasks`.
     :returns: Whatever ``nailgun.entities.Subscription.upload`` returns.
 
     """
     return entities.Subscription().upload(
-        data={'organization_id': organization_id}, files={'content': manifest}
+        data={'organization_id': organization_id},
+        files={'content': manifest},
+        synchronous=synchronous,
     )
 
 
@@ -146,29 +439,25 @@ def delete_puppet_class(
     """
     # Find puppet class
     puppet_classes = entities.PuppetClass().search(
-        query={'search': 'name = "{0}"'.format(puppetclass_name)}
+        query={'search': f'name = "{puppetclass_name}"'}
     )
     # And all subclasses
     puppet_classes.extend(
-        entities.PuppetClass().search(query={'search': 'name ~ "{0}::"'.format(puppetclass_name)})
+        entities.PuppetClass().search(query={'search': f'name ~ "{puppetclass_name}::"'})
     )
     for puppet_class in puppet_classes:
         # Search and remove puppet class from affected hostgroups
         for hostgroup in puppet_class.read().hostgroup:
             hostgroup.delete_puppetclass(data={'puppetclass_id': puppet_class.id})
         # Search and remove puppet class from affected hosts
-        for host in entities.Host().search(
-            query={'search': 'class={0}'.format(puppet_class.name)}
-        ):
+        for host in entities.Host().search(query={'search': f'class={puppet_class.name}'}):
             host.delete_puppetclass(data={'puppetclass_id': puppet_class.id})
         # Remove puppet class entity
         puppet_class.delete()
     # And remove puppet module from the system if puppet_module name provided
     if puppet_module and proxy_hostname and environment_name:
         ssh.command('puppet module uninstall --force {0}'.format(puppet_module))
-        env = entities.Environment().search(
-            query={'search': 'name="{0}"'.format(environment_name)}
-        )[0]
+        env = entities.Environment().search(query={'search': f'name="{environment_name}"'})[0]
         proxy = entities.SmartProxy(name=proxy_hostname).search()[0]
         proxy.import_puppetclasses(environment=env)
 
@@ -300,20 +589,18 @@ def configure_provisioning(org=None, loc=None, compute=False, os=None):
         product=product, url=settings.rhel7_os, download_policy='immediate'
     ).create()
 
-    # Increased timeout value for repo sync and CV publishing and promotion
-    try:
-        old_task_timeout = entity_mixins.TASK_TIMEOUT
-        entity_mixins.TASK_TIMEOUT = 3600
-        repo.sync()
-        # Create, Publish and promote CV
-        content_view = entities.ContentView(organization=org).create()
-        content_view.repository = [repo]
-        content_view = content_view.update(['repository'])
-        content_view.publish()
-        content_view = content_view.read()
-        promote(content_view.version[0], lc_env.id)
-    finally:
-        entity_mixins.TASK_TIMEOUT = old_task_timeout
+    # Increased timeout value for repo sync and CV publishing and promotion,
+    # the tasks are polled here instead of changing the global task timeout
+    task = repo.sync(synchronous=False)
+    entities.ForemanTask(id=task['id']).poll(timeout=3600)
+    # Create, Publish and promote CV
+    content_view = entities.ContentView(organization=org).create()
+    content_view.repository = [repo]
+    content_view = content_view.update(['repository'])
+    task = content_view.publish(synchronous=False)
+    entities.ForemanTask(id=task['id']).poll(timeout=3600)
+    content_view = content_view.read()
+    promote(content_view.version[0], lc_env.id, timeout=3600)
     # Search for existing organization puppet environment, otherwise create a
     # new one, associate organization and location where it is appropriate.
     environments = entities.Environment().search(
@@ -327,9 +614,7 @@ def configure_provisioning(org=None, loc=None, compute=False, os=None):
         environment = entities.Environment(organization=[org], location=[loc]).create()
 
     # Search for SmartProxy, and associate location
-    proxy = entities.SmartProxy().search(
-        query={'search': 'name={0}'.format(settings.server.hostname)}
-    )
+    proxy = entities.SmartProxy().search(query={'search': f'name={settings.server.hostname}'})
     proxy = proxy[0].read()
     proxy.location.append(loc)
     proxy.organization.append(org)
@@ -338,7 +623,7 @@ def configure_provisioning(org=None, loc=None, compute=False, os=None):
     # Search for existing domain or create new otherwise. Associate org,
     # location and dns to it
     _, _, domain = settings.server.hostname.partition('.')
-    domain = entities.Domain().search(query={'search': 'name="{0}"'.format(domain)})
+    domain = entities.Domain().search(query={'search': f'name="{domain}"'})
     if len(domain) == 1:
         domain = domain[0].read()
         domain.location.append(loc)
@@ -352,7 +637,7 @@ def configure_provisioning(org=None, loc=None, compute=False, os=None):
     # If so, just update its relevant fields otherwise,
     # Create new subnet
     network = settings.vlan_networking.subnet
-    subnet = entities.Subnet().search(query={'search': 'network={0}'.format(network)})
+    subnet = entities.Subnet().search(query={'search': f'network={network}'})
     if len(subnet) == 1:
         subnet = subnet[0].read()
         subnet.domain = [domain]
@@ -386,7 +671,7 @@ def configure_provisioning(org=None, loc=None, compute=False, os=None):
     # Create new compute-resource with 'libvirt' provider.
     # compute boolean is added to not block existing test's that depend on
     # Libvirt resource and use this same functionality to all CR's.
-    if compute is False:
+    if not compute:
         resource_url = 'qemu+ssh://root@{0}/system'.format(
             settings.compute_resources.libvirt_hostname
         )
@@ -413,9 +698,7 @@ def configure_provisioning(org=None, loc=None, compute=False, os=None):
 
     # Get the Partition table ID
     ptable = (
-        entities.PartitionTable()
-        .search(query={'search': 'name="{0}"'.format(DEFAULT_PTABLE)})[0]
-        .read()
+        entities.PartitionTable().search(query={'search': f'name="{DEFAULT_PTABLE}"'})[0].read()
     )
     ptable.location.append(loc)
     ptable.organization.append(org)
@@ -451,7 +734,7 @@ def configure_provisioning(org=None, loc=None, compute=False, os=None):
 
     # Get the Provisioning template_ID and update with OS, Org, Location
     provisioning_template = entities.ProvisioningTemplate().search(
-        query={'search': 'name="{0}"'.format(DEFAULT_TEMPLATE)}
+        query={'search': f'name="{DEFAULT_TEMPLATE}"'}
     )
     provisioning_template = provisioning_template[0].read()
     provisioning_template.operatingsystem.append(os)
@@ -463,7 +746,7 @@ def configure_provisioning(org=None, loc=None, compute=False, os=None):
 
     # Get the PXE template ID and update with OS, Org, location
     pxe_template = entities.ProvisioningTemplate().search(
-        query={'search': 'name="{0}"'.format(DEFAULT_PXE_TEMPLATE)}
+        query={'search': f'name="{DEFAULT_PXE_TEMPLATE}"'}
     )
     pxe_template = pxe_template[0].read()
     pxe_template.operatingsystem.append(os)
@@ -474,7 +757,7 @@ def configure_provisioning(org=None, loc=None, compute=False, os=None):
     # Get the arch ID
     arch = (
         entities.Architecture()
-        .search(query={'search': 'name="{0}"'.format(DEFAULT_ARCHITECTURE)})[0]
+        .search(query={'search': f'name="{DEFAULT_ARCHITECTURE}"'})[0]
         .read()
     )
 
@@ -547,22 +830,26 @@ def create_role_permissions(role, permissions_types_names, search=None):  # prag
     """
     for resource_type, permissions_name in permissions_types_names.items():
         if resource_type is None:
+            # fetch all the requested permissions with a single search
+            found_permissions = {}
+            if permissions_name:
+                for entity_permission in search_iter(
+                    entities.Permission(),
+                    query={'search': f'name ^ ({", ".join(permissions_name)})'},
+                ):
+                    found_permissions.setdefault(entity_permission.name, []).append(
+                        entity_permission
+                    )
             permissions_entities = []
             for name in permissions_name:
-                result = entities.Permission().search(query={'search': f'name="{name}"'})
+                result = found_permissions.get(name)
                 if not result:
                     raise entities.APIResponseError('permission "{}" not found'.format(name))
                 if len(result) > 1:
                     raise entities.APIResponseError(
                         'found more than one entity for permission "{}"'.format(name)
                     )
-                entity_permission = result[0]
-                if entity_permission.name != name:
-                    raise entities.APIResponseError(
-                        'the returned permission is different from the'
-                        ' requested one "{0} != {1}"'.format(entity_permission.name, name)
-                    )
-                permissions_entities.append(entity_permission)
+                permissions_entities.append(result[0])
         else:
             if not permissions_name:
                 raise ValueError(
@@ -570,19 +857,23 @@ def create_role_permissions(role, permissions_types_names, search=None):  # prag
                     ' least one permission'.format(resource_type)
                 )
 
-            resource_type_permissions_entities = entities.Permission().search(
-                query={'per_page': 350, 'search': f'resource_type="{resource_type}"'}
-            )
-            if not resource_type_permissions_entities:
+            permissions_names = set(permissions_name)
+            permissions_entities = []
+            resource_type_found = False
+            for entity in search_iter(
+                entities.Permission(), query={'search': f'resource_type="{resource_type}"'}
+            ):
+                resource_type_found = True
+                if entity.name in permissions_names:
+                    permissions_entities.append(entity)
+                    if len(permissions_entities) == len(permissions_names):
+                        # stop fetching pages once all the permissions are found
+                        break
+            if not resource_type_found:
                 raise entities.APIResponseError(
                     'resource type "{}" permissions not found'.format(resource_type)
                 )
 
-            permissions_entities = [
-                entity
-                for entity in resource_type_permissions_entities
-                if entity.name in permissions_name
-            ]
             # ensure that all the requested permissions entities where
             # retrieved
             permissions_entities_names = {entity.name for entity in permissions_entities}
@@ -622,6 +913,21 @@ def wait_for_tasks(search_query, search_rate=1, max_tries=10, poll_rate=None, po
     return tasks
 
 
+@functools.lru_cache(maxsize=1)
+def get_pulp_credentials():
+    """Return the pulp admin credentials configured on the server.
+
+    The password is read from the server only once and cached for the rest of
+    the session as it does not change between calls.
+
+    :return: A ``(username, password)`` tuple.
+    """
+    pulp_pass = ssh.command(
+        'grep "^default_password" /etc/pulp/server.conf | awk \'{print $2}\''
+    ).stdout[0]
+    return 'admin', pulp_pass
+
+
 def wait_for_syncplan_tasks(repo_backend_id=None, timeout=10, repo_name=None):
     """Search the pulp tasks and identify repositories sync tasks with
     specified name or backend_identifier
@@ -634,13 +940,11 @@ def wait_for_syncplan_tasks(repo_backend_id=None, timeout=10, repo_name=None):
     if repo_name:
         repo_backend_id = (
             entities.Repository()
-            .search(query={'search': 'name="{0}"'.format(repo_name), 'per_page': 1000})[0]
+            .search(query={'search': f'name="{repo_name}"', 'per_page': 1000})[0]
             .backend_identifier
         )
-    # Fetch the Pulp password
-    pulp_pass = ssh.command(
-        'grep "^default_password" /etc/pulp/server.conf | awk \'{print $2}\''
-    ).stdout[0]
+    # Fetch the Pulp credentials
+    pulp_auth = get_pulp_credentials()
     # Set the Timeout value
     timeup = time.time() + int(timeout) * 60
     # Search Filter to filter out the task based on backend-id and sync action
@@ -652,20 +956,14 @@ def wait_for_syncplan_tasks(repo_backend_id=None, timeout=10, repo_name=None):
             }
         }
     }
+    search_url = '{0}/pulp/api/v2/tasks/search/'.format(settings.server.get_url())
     while True:
         if time.time() > timeup:
             raise entities.APIResponseError(
                 'Pulp task with repo_id {0} not found'.format(repo_backend_id)
             )
         # Send request to pulp API to get the task info
-        req = request(
-            'POST',
-            '{0}/pulp/api/v2/tasks/search/'.format(settings.server.get_url()),
-            verify=False,
-            auth=('admin', '{0}'.format(pulp_pass)),
-            headers={'content-type': 'application/json'},
-            data=filtered_req,
-        )
+        req = get_http_session().post(search_url, verify=False, auth=pulp_auth, json=filtered_req)
         # Check Status code of response
         if req.status_code != 200:
             raise entities.APIResponseError(
@@ -674,12 +972,14 @@ def wait_for_syncplan_tasks(repo_backend_id=None, timeout=10, repo_name=None):
         # Check content of response
         # It is '[]' string for empty content when backend_identifier is wrong
         if len(req.content) > 2:
-            if req.json()[0].get('state') in ['finished']:
+            # parse the response only once, only its first task is checked
+            task = json_loads(req.content)[0]
+            if task.get('state') in ['finished']:
                 return True
-            elif req.json()[0].get('error'):
+            elif task.get('error'):
                 raise AssertionError(
                     "Pulp task with repo_id {0} errored or not "
-                    "found: '{1}'".format(repo_backend_id, req.json().get('error'))
+                    "found: '{1}'".format(repo_backend_id, task['error'])
                 )
         time.sleep(2)
 
@@ -774,7 +1074,7 @@ def update_vm_host_location(vm_client, location_id):
     :param vm_client: A subscribed Virtual Machine client instance.
     :param location_id: The location id to update the vm_client host with.
     """
-    host = entities.Host().search(query={'search': 'name={0}'.format(vm_client.hostname)})[0]
+    host = entities.Host().search(query={'search': f'name={vm_client.hostname}'})[0]
     host.location = entities.Location(id=location_id)
     host.update(['location'])
 
@@ -786,7 +1086,7 @@ def check_create_os_with_title(os_title):
     :return: Created or found OS
     """
     # Check if OS that image needs is present or no, If not create the OS
-    result = entities.OperatingSystem().search(query={'search': 'title="{0}"'.format(os_title)})
+    result = entities.OperatingSystem().search(query={'search': f'title="{os_title}"'})
     if result:
         os = result[0]
     else:
@@ -798,18 +1098,33 @@ def check_create_os_with_title(os_title):
     return os
 
 
+def attach_custom_product_subscriptions(prod_names, host_name, quantity=1):
+    """ Attach several custom product subscriptions to client host at once
+
+    All the subscriptions are sent in a single ``add_subscriptions`` request.
+
+    :param list prod_names: custom product names
+    :param str host_name: client host name
+    :param int quantity: quantity of each subscription to attach
+    """
+    host = entities.Host().search(query={'search': host_name})[0]
+    subscriptions = []
+    for prod_name in prod_names:
+        product_subscription = entities.Subscription().search(
+            query={'search': f'name={prod_name}'}
+        )[0]
+        subscriptions.append({'id': product_subscription.id, 'quantity': quantity})
+    entities.HostSubscription(host=host.id).add_subscriptions(
+        data={'subscriptions': subscriptions}
+    )
+
+
 def attach_custom_product_subscription(prod_name=None, host_name=None):
     """ Attach custom product subscription to client host
     :param str prod_name: custom product name
     :param str host_name: client host name
     """
-    host = entities.Host().search(query={'search': '{0}'.format(host_name)})[0]
-    product_subscription = entities.Subscription().search(
-        query={'search': 'name={0}'.format(prod_name)}
-    )[0]
-    entities.HostSubscription(host=host.id).add_subscriptions(
-        data={'subscriptions': [{'id': product_subscription.id, 'quantity': 1}]}
-    )
+    attach_custom_product_subscriptions([prod_name], host_name)
 
 
 class templateupdate:
@@ -852,7 +1167,7 @@ def update_provisioning_template(name=None, old=None, new=None):
     """
     temp = (
         entities.ProvisioningTemplate()
-        .search(query={'per_page': 1000, 'search': 'name="{}"'.format(name)})[0]
+        .search(query={'per_page': 1000, 'search': f'name="{name}"'})[0]
         .read()
     )
     if old in temp.template:
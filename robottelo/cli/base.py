@@ -157,6 +157,18 @@ class Base(object):
             cls.logger.warning('stderr contains following message:\n{0}'.format(response.stderr))
         return response.stdout
 
+    @classmethod
+    def _get_created_id(cls, result):
+        """Return the ID of the record created by a ``create`` like command.
+
+        :param result: The parsed CSV output of the command.
+        :returns: The ``id`` of the first record of ``result`` or ``None`` if
+            the command did not output any record ID.
+        """
+        if result and 'id' in result[0]:
+            return result[0]['id']
+        return None
+
     @classmethod
     def add_operating_system(cls, options=None):
         """
@@ -183,8 +195,8 @@ class Base(object):
         result = cls.execute(cls._construct_command(options), output_format='csv', timeout=timeout)
 
         # Extract new object ID if it was successfully created
-        if len(result) > 0 and 'id' in result[0]:
-            obj_id = result[0]['id']
+        obj_id = cls._get_created_id(result)
+        if obj_id is not None:
 
             # Fetch new object
             # Some Katello obj require the organization-id for subcommands
@@ -257,15 +269,9 @@ class Base(object):
 
         """
         if username is None:
-            try:
-                username = getattr(cls, 'foreman_admin_username')
-            except AttributeError:
-                username = settings.server.admin_username
+            username = getattr(cls, 'foreman_admin_username', settings.server.admin_username)
         if password is None:
-            try:
-                password = getattr(cls, 'foreman_admin_password')
-            except AttributeError:
-                password = settings.server.admin_password
+            password = getattr(cls, 'foreman_admin_password', settings.server.admin_password)
 
         return (username, password)
 
@@ -283,9 +289,8 @@ class Base(object):
     ):
         """Executes the cli ``command`` on the server via ssh"""
         user, password = cls._get_username_password(user, password)
-        time_hammer = False
-        if settings.performance:
-            time_hammer = settings.performance.time_hammer
+        performance = settings.performance
+        time_hammer = performance.time_hammer if performance else False
 
         # add time to measure hammer performance
         cmd = 'LANG={0} {1} hammer -v {2} {3} {4} {5}'.format(
@@ -455,7 +460,7 @@ class Base(object):
     @classmethod
     def _construct_command(cls, options=None):
         """Build a hammer cli command based on the options passed"""
-        tail = ''
+        tail = []
 
         if options is None:
             options = {}
@@ -464,11 +469,11 @@ class Base(object):
             if val is None:
                 continue
             if val is True:
-                tail += ' --{0}'.format(key)
+                tail.append(f'--{key}')
             elif val is not False:
                 if isinstance(val, list):
-                    val = ','.join(str(el) for el in val)
-                tail += ' --{0}="{1}"'.format(key, val)
-        cmd = f"{cls.command_base} {cls.command_sub or ''} {tail.strip()}"
+                    val = ','.join(map(str, val))
+                tail.append(f'--{key}="{val}"')
+        cmd = f"{cls.command_base} {cls.command_sub or ''} {' '.join(tail)}"
 
         return cmd
@@ -61,8 +61,8 @@ class ContentViewFilterRule(Base):
         result = cls.execute(cls._construct_command(options), output_format='csv')
 
         # Extract new CV filter rule ID if it was successfully created
-        if len(result) > 0 and 'id' in result[0]:
-            cvfr_id = result[0]['id']
+        cvfr_id = cls._get_created_id(result)
+        if cvfr_id is not None:
             # CV filter rule can only be fetched by specifying either
             # content-view-filter-id or content-view-filter + content-view-id.
             # Passing these options to info command
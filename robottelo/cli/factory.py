@@ -3,11 +3,15 @@
 Factory object creation for all CLI methods
 """
 import datetime
+import functools
 import json
 import logging
 import os
 import random
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from os import chmod
 from tempfile import mkstemp
 from time import sleep
@@ -79,6 +83,7 @@ from robottelo.constants import DEFAULT_SUBSCRIPTION_NAME
 from robottelo.constants import DEFAULT_TEMPLATE
 from robottelo.constants import DISTRO_RHEL7
 from robottelo.constants import DISTROS_MAJOR_VERSION
+from robottelo.constants import ENVIRONMENT
 from robottelo.constants import FOREMAN_PROVIDERS
 from robottelo.constants import OPERATING_SYSTEMS
 from robottelo.constants import PRDS
@@ -102,12 +107,34 @@ logger = logging.getLogger(__name__)
 ORG_KEYS = ['organization', 'organization-id', 'organization-label']
 CONTENT_VIEW_KEYS = ['content-view', 'content-view-id']
 LIFECYCLE_KEYS = ['lifecycle-environment', 'lifecycle-environment-id']
+# Maps the Satellite Tools repository names to their ``settings.sattools_repo`` key
+SATTOOLS_REPO_RELEASES = {REPOS['rhst6']['name']: 'rhel6', REPOS['rhst7']['name']: 'rhel7'}
 
 
 class CLIFactoryError(Exception):
     """Indicates an error occurred while creating an entity using hammer"""
 
 
+@functools.lru_cache(maxsize=None)
+def get_proxy_id(hostname):
+    """Return the id of the smart proxy with the given hostname.
+
+    The id is looked up only once per hostname, use
+    ``get_proxy_id.cache_clear()`` to force a new lookup.
+    """
+    return Proxy.list({'search': hostname})[0]['id']
+
+
+@functools.lru_cache(maxsize=None)
+def get_library_lce_id(org_id):
+    """Return the id of the Library lifecycle environment of an organization.
+
+    The Library environment never changes for a given organization, so the id
+    is looked up only once per organization.
+    """
+    return LifecycleEnvironment.info({'name': ENVIRONMENT, 'organization-id': org_id})['id']
+
+
 def create_object(cli_object, options, values):
     """
     Creates <object> with dictionary of arguments.
@@ -122,8 +149,10 @@ def create_object(cli_object, options, values):
     :return: A dictionary representing the newly created resource.
 
     """
-    if values:
-        diff = set(values.keys()).difference(set(options.keys()))
+    # The unsupported options are only reported, skip looking for them when the
+    # message would not be logged anyway
+    if values and logger.isEnabledFor(logging.DEBUG):
+        diff = values.keys() - options.keys()
         if diff:
             logger.debug(
                 "Option(s) {0} not supported by CLI factory. Please check for "
@@ -142,7 +171,7 @@ def create_object(cli_object, options, values):
 
     # Sometimes we get a list with a dictionary and not
     # a dictionary.
-    if type(result) is list and len(result) > 0:
+    if isinstance(result, list) and len(result) > 0:
         result = result[0]
 
     return result
@@ -514,9 +543,9 @@ def make_product_wait(options=None, wait_for=5):
     This is a temporary workaround for BZ#1332650: Sometimes cli product
     create errors for no reason when there are multiple product creation
     requests at the sametime although the product entities are created.  This
-    workaround will attempt to wait for 5 seconds and query the
-    product again to make sure it is actually created.  If it is not found,
-    it will fail and stop.
+    workaround will query the product again, backing off exponentially for up
+    to ``wait_for`` seconds, to make sure it is actually created.  If it is
+    not found, it will fail and stop.
 
     Note: This wrapper method is created instead of patching make_product
     because this issue does not happen for all entities and this workaround
@@ -529,13 +558,23 @@ def make_product_wait(options=None, wait_for=5):
     try:
         product = make_product(options)
     except CLIFactoryError as err:
-        sleep(wait_for)
-        try:
-            product = Product.info(
-                {'name': options.get('name'), 'organization-id': options.get('organization-id')}
-            )
-        except CLIReturnCodeError:
-            raise err
+        product = None
+        delay = 0.25
+        waited = 0
+        while not product and waited < wait_for:
+            delay = min(delay, wait_for - waited)
+            sleep(delay)
+            waited += delay
+            delay *= 2
+            try:
+                product = Product.info(
+                    {
+                        'name': options.get('name'),
+                        'organization-id': options.get('organization-id'),
+                    }
+                )
+            except CLIReturnCodeError:
+                product = None
         if not product:
             raise err
     return product
@@ -846,6 +885,33 @@ def make_host(options=None):
     return create_object(Host, args, options)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_default_org_id():
+    """Return the default organization id or create a new organization."""
+    try:
+        return Org.info({'name': DEFAULT_ORG})['id']
+    except CLIReturnCodeError:
+        return make_org()['id']
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_location_id():
+    """Return the default location id or create a new location."""
+    try:
+        return Location.info({'name': DEFAULT_LOC})['id']
+    except CLIReturnCodeError:
+        return make_location()['id']
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_architecture_id():
+    """Return the default architecture id or create a new architecture."""
+    try:
+        return Architecture.info({'name': DEFAULT_ARCHITECTURE})['id']
+    except CLIReturnCodeError:
+        return make_architecture()['id']
+
+
 @cacheable
 def make_fake_host(options=None):
     """Wrapper function for make_host to pass all required options for creation
@@ -855,17 +921,21 @@ def make_fake_host(options=None):
         options = {}
 
     # Try to use default Satellite entities, otherwise create them if they were
-    # not passed or defined previously
+    # not passed or defined previously. Organization, location and
+    # architecture do not depend on each other so they are resolved
+    # concurrently, and only once per session as they are shared by all the
+    # fake hosts.
+    defaults = {}
     if not options.get('organization') and not options.get('organization-id'):
-        try:
-            options['organization-id'] = Org.info({'name': DEFAULT_ORG})['id']
-        except CLIReturnCodeError:
-            options['organization-id'] = make_org()['id']
+        defaults['organization-id'] = _get_default_org_id
     if not options.get('location') and not options.get('location-id'):
-        try:
-            options['location-id'] = Location.info({'name': DEFAULT_LOC})['id']
-        except CLIReturnCodeError:
-            options['location-id'] = make_location()['id']
+        defaults['location-id'] = _get_default_location_id
+    if not options.get('architecture') and not options.get('architecture-id'):
+        defaults['architecture-id'] = _get_default_architecture_id
+    if defaults:
+        with ThreadPoolExecutor(max_workers=len(defaults)) as executor:
+            futures = {key: executor.submit(getter) for key, getter in defaults.items()}
+        options.update({key: future.result() for key, future in futures.items()})
     if not options.get('domain') and not options.get('domain-id'):
         options['domain-id'] = make_domain(
             {
@@ -875,11 +945,6 @@ def make_fake_host(options=None):
                 'organizations': options.get('organization'),
             }
         )['id']
-    if not options.get('architecture') and not options.get('architecture-id'):
-        try:
-            options['architecture-id'] = Architecture.info({'name': DEFAULT_ARCHITECTURE})['id']
-        except CLIReturnCodeError:
-            options['architecture-id'] = make_architecture()['id']
     if not options.get('operatingsystem') and not options.get('operatingsystem-id'):
         try:
             options['operatingsystem-id'] = OperatingSys.list(
@@ -1260,7 +1325,7 @@ def make_report_template(options=None):
 
     :returns ReportTemplate object
     """
-    if options is not None and 'content' in options.keys():
+    if options is not None and 'content' in options:
         content = options.pop('content')
     else:
         content = gen_alphanumeric()
@@ -1355,7 +1420,7 @@ def make_domain(options=None):
         'dns-id': None,
         'location-ids': None,
         'locations': None,
-        'name': gen_alphanumeric().lower(),
+        'name': uuid.uuid4().hex[:12],
         'organization-ids': None,
         'organizations': None,
     }
@@ -1549,7 +1614,7 @@ def make_template(options=None):
     }
 
     # Write content to file or random text
-    if options is not None and 'content' in options.keys():
+    if options is not None and 'content' in options:
         content = options.pop('content')
     else:
         content = gen_alphanumeric()
@@ -1648,7 +1713,7 @@ def activationkey_add_subscription_to_repo(options=None):
         {'organization-id': options['organization-id']}, per_page=False
     )
     # Add subscription to activation-key
-    if options['subscription'] not in (sub['name'] for sub in subscriptions):
+    if options['subscription'] not in map(itemgetter('name'), subscriptions):
         raise CLIFactoryError(
             'Subscription {0} not found in the given org'.format(options['subscription'])
         )
@@ -1936,11 +2001,10 @@ def setup_org_for_a_rh_repo(options=None, force_manifest_upload=False, force_use
         ``setup_org_for_a_custom_repo``).
     """
     custom_repo_url = None
-    if options.get('repository') == REPOS['rhst6']['name']:
-        custom_repo_url = settings.sattools_repo['rhel6']
-    elif options.get('repository') == REPOS['rhst7']['name']:
-        custom_repo_url = settings.sattools_repo['rhel7']
-    elif 'Satellite Capsule' in options.get('repository'):
+    repository = options.get('repository')
+    if repository in SATTOOLS_REPO_RELEASES:
+        custom_repo_url = settings.sattools_repo[SATTOOLS_REPO_RELEASES[repository]]
+    elif 'Satellite Capsule' in repository:
         custom_repo_url = settings.capsule_repo
     if force_use_cdn or settings.cdn or not custom_repo_url:
         return _setup_org_for_a_rh_repo(options)
@@ -1987,14 +2051,14 @@ def configure_env_for_provision(org=None, loc=None):
         loc = make_location()
 
     # Get a Library Lifecycle environment and the default CV for the org
-    lce = LifecycleEnvironment.info({'name': 'Library', 'organization-id': org['id']})
+    lce_id = get_library_lce_id(org['id'])
     cv = ContentView.info({'name': 'Default Organization View', 'organization-id': org['id']})
 
     # Create puppet environment and associate organization and location
     env = make_environment({'location-ids': loc['id'], 'organization-ids': org['id']})
 
     # get default capsule and associate location
-    puppet_proxy = Proxy.info({'id': Proxy.list({'search': settings.server.hostname})[0]['id']})
+    puppet_proxy = Proxy.info({'id': get_proxy_id(settings.server.hostname)})
     Proxy.update(
         {
             'id': puppet_proxy['id'],
@@ -2141,7 +2205,7 @@ def configure_env_for_provision(org=None, loc=None):
         {
             'location-ids': loc['id'],
             'environment-id': env['id'],
-            'lifecycle-environment-id': lce['id'],
+            'lifecycle-environment-id': lce_id,
             'puppet-proxy-id': puppet_proxy['id'],
             'puppet-ca-proxy-id': puppet_proxy['id'],
             'content-view-id': cv['id'],
@@ -1,9 +1,21 @@
 """Helpers to interact with hammer command line utility."""
 import csv
+import functools
 import io
-import json
 import re
 
+from robottelo.utils import json_loads
+
+_HELP_OPTION_REGEX = re.compile(
+    r'^ (-(?P<shortname>\w), )?(--(\[.*?\])?(?P<name>[\w\[\]|-]+))?'
+    r'(, --(?P<deprecation_name>[\w-]+))?( (?P<value>[\w-]+))?\s+(?P<help>.*)$'
+)
+_HELP_SUBCOMMAND_REGEX = re.compile(r'^ (?P<name>[\w-]+)?(, [\w-]+)?\s+(?P<description>.*)$')
+_HELP_GROUPED_OPTION_REGEX = re.compile(r'^(?P<prefix>[\w-]+)\[(?P<postfixes>\S+)\]$')
+_INFO_NUMBERED_VALUE_REGEX = re.compile(r'\d+\)\s+(.+)$')
+_INFO_VALUE_REGEX = re.compile(r'(.*)$')
+_INFO_NUMBERED_KEY_REGEX = re.compile(r'(\d+)\)')
+
 
 def _csv_reader(output):
     """An unicode CSV reader which processes unicode strings and return unicode
@@ -31,8 +43,12 @@ def _csv_reader(output):
         yield row
 
 
+@functools.lru_cache(maxsize=1024)
 def _normalize(header):
     """Replace empty spaces with '-' and lower all chars
+
+    Hammer outputs a small set of field names, so the normalized names are
+    cached.
     """
     return header.replace(' ', '-').lower()
 
@@ -44,7 +60,7 @@ def parse_json(stdout):
     new_object_index = stdout.find('\n}\n{')
     if new_object_index > -1:
         stdout = stdout[new_object_index + 3 :]  # noqa: E203
-    parsed = json.loads(stdout)
+    parsed = json_loads(stdout)
     return _normalize_obj(parsed)
 
 
@@ -55,13 +71,32 @@ def _normalize_obj(obj):
     if isinstance(obj, dict):
         return {_normalize(k): _normalize_obj(v) for k, v in obj.items()}
     elif isinstance(obj, list):
-        return [_normalize_obj(v) for v in obj]
+        return _normalize_list(obj)
     # doing this to conform to csv parser
     elif isinstance(obj, int) and not isinstance(obj, bool):
         return str(obj)
     return obj
 
 
+def _normalize_list(items):
+    """Normalize all the items of a list.
+
+    The records returned by a hammer list command all share the same keys, so
+    the normalized keys are computed only once for each distinct set of keys.
+    """
+    shapes = {}
+    normalized = []
+    for item in items:
+        if isinstance(item, dict):
+            keys = tuple(item)
+            if keys not in shapes:
+                shapes[keys] = [_normalize(k) for k in keys]
+            normalized.append(dict(zip(shapes[keys], map(_normalize_obj, item.values()))))
+        else:
+            normalized.append(_normalize_obj(item))
+    return normalized
+
+
 def parse_csv(output):
     """Parse CSV output from Hammer CLI and convert it to python dictionary."""
     try:
@@ -89,11 +124,6 @@ def parse_help(output):
     options_section_state = 2
 
     contents = {'subcommands': [], 'options': []}
-    option_regex = re.compile(
-        r'^ (-(?P<shortname>\w), )?(--(\[.*?\])?(?P<name>[\w\[\]|-]+))?'
-        r'(, --(?P<deprecation_name>[\w-]+))?( (?P<value>[\w-]+))?\s+(?P<help>.*)$'
-    )
-    subcommand_regex = re.compile(r'^ (?P<name>[\w-]+)?(, [\w-]+)?\s+(?P<description>.*)$')
 
     for line in output:
         if len(line.strip()) == 0:
@@ -106,7 +136,7 @@ def parse_help(output):
             continue
 
         if state == subcommands_section_state:
-            match = subcommand_regex.search(line)
+            match = _HELP_SUBCOMMAND_REGEX.search(line)
             if match is None:  # pragma: no cover
                 continue
             if match.group('name') is None:
@@ -118,7 +148,7 @@ def parse_help(output):
                     {'name': match.group('name'), 'description': match.group('description')}
                 )
         if state == options_section_state:
-            match = option_regex.search(line)
+            match = _HELP_OPTION_REGEX.search(line)
             if match is None:  # pragma: no cover
                 continue
             if match.group('name') is None:
@@ -134,10 +164,9 @@ def parse_help(output):
                 )
 
     # handle multiple options disguised as one, e.g. --hostgroup[s|-ids|-titles]
-    grouped_option_regex = re.compile(r'^(?P<prefix>[\w-]+)\[(?P<postfixes>\S+)\]$')
     new_options = []
     for option in contents['options']:
-        match = grouped_option_regex.search(option['name'])
+        match = _HELP_GROUPED_OPTION_REGEX.search(option['name'])
         if not match:
             new_options.append(option)
             continue
@@ -233,10 +262,10 @@ def parse_info(output):
                 # Template
                 #  template1
                 #  template2
-                match = re.match(r'\d+\)\s+(.+)$', line.lstrip())
+                match = _INFO_NUMBERED_VALUE_REGEX.match(line.lstrip())
 
                 if match is None:
-                    match = re.match(r'(.*)$', line.lstrip())
+                    match = _INFO_VALUE_REGEX.match(line.lstrip())
 
                 value = match.group(1)
 
@@ -265,14 +294,14 @@ def parse_info(output):
                 #     URL:       /custom/4f84fc90-9ffa-...
                 #  2) Repo Name: puppet1
                 #     URL:       /custom/4f84fc90-9ffa-...
-                starts_with_number = re.match(r'(\d+)\)', key)
+                starts_with_number = _INFO_NUMBERED_KEY_REGEX.match(key)
                 if starts_with_number:
                     sub_num = int(starts_with_number.group(1))
                     # no. 1) we need to change dict() to list()
                     if sub_num == 1:
                         contents[sub_prop] = []
                     # remove number from key
-                    key = re.sub(r'\d+\)', '', key)
+                    key = _INFO_NUMBERED_KEY_REGEX.sub('', key)
                     # append empty dict to array
                     contents[sub_prop].append({})
 
@@ -78,8 +78,8 @@ class ReportTemplate(Base):
         result = cls.execute(cls._construct_command(options), output_format='csv')
 
         # Extract new object ID if it was successfully created
-        if len(result) > 0 and 'id' in result[0]:
-            obj_id = result[0]['id']
+        obj_id = cls._get_created_id(result)
+        if obj_id is not None:
 
             # Fetch new object
             # Some Katello obj require the organization-id for subcommands
@@ -38,8 +38,9 @@ class Role(Base):
         cls.command_sub = 'clone'
         result = cls.execute(cls._construct_command(options), output_format='csv')
         # Fetch new role
-        if len(result) > 0 and 'id' in result[0]:
-            new_role = cls.info({'id': result[0]['id']})
+        role_id = cls._get_created_id(result)
+        if role_id is not None:
+            new_role = cls.info({'id': role_id})
             if len(new_role) > 0:
                 result = new_role
         return result
@@ -155,7 +155,8 @@ class UserGroupExternal(Base):
         result = cls.execute(cls._construct_command(options), output_format='csv')
         # External user group can only be fetched by specifying both id and
         # user group id it is linked to
-        if len(result) > 0 and 'id' in result[0]:
-            info_options = {'user-group-id': options.get('user-group-id'), 'id': result[0]['id']}
+        obj_id = cls._get_created_id(result)
+        if obj_id is not None:
+            info_options = {'user-group-id': options.get('user-group-id'), 'id': obj_id}
             result = cls.info(info_options)
         return result
@@ -1,4 +1,5 @@
 """Define and instantiate the configuration class for Robottelo."""
+import functools
 import importlib
 import logging.config
 import os
@@ -9,6 +10,7 @@ from urllib.parse import urljoin
 from urllib.parse import urlunsplit
 
 import airgun.settings
+import urllib3
 import yaml
 from nailgun import entities
 from nailgun import entity_mixins
@@ -22,6 +24,24 @@ LOGGER = logging.getLogger(__name__)
 SETTINGS_FILE_NAME = 'robottelo.properties'
 
 
+@functools.lru_cache(maxsize=32)
+def _build_server_url(scheme, hostname, port):
+    """Build a server URL, the URLs are cached as they are requested for every
+    API and UI call.
+    """
+    if not port:
+        return urlunsplit((scheme, hostname, '', '', ''))
+    return urlunsplit((scheme, '{0}:{1}'.format(hostname, port), '', '', ''))
+
+
+@functools.lru_cache(maxsize=32)
+def _build_pub_url(hostname, path=''):
+    """Build the URL of a ``path`` in the server pub directory, cached like
+    ``_build_server_url``.
+    """
+    return urljoin(urlunsplit(('http', hostname, 'pub/', '', '')), path)
+
+
 class ImproperlyConfigured(Exception):
     """Indicates that Robottelo somehow is improperly configured.
 
@@ -195,15 +215,8 @@ class ServerSettings(FeatureSettings):
         :rtype: str
 
         """
-        if not self.scheme:
-            scheme = 'https'
-        else:
-            scheme = self.scheme
         # All anticipated error cases have been handled at this point.
-        if not self.port:
-            return urlunsplit((scheme, self.hostname, '', '', ''))
-        else:
-            return urlunsplit((scheme, '{0}:{1}'.format(self.hostname, self.port), '', '', ''))
+        return _build_server_url(self.scheme or 'https', self.hostname, self.port)
 
     def get_pub_url(self):
         """Return the pub URL of the server being tested.
@@ -216,7 +229,7 @@ class ServerSettings(FeatureSettings):
         :rtype: str
 
         """
-        return urlunsplit(('http', self.hostname, 'pub/', '', ''))
+        return _build_pub_url(self.hostname)
 
     def get_cert_rpm_url(self):
         """Return the Katello cert RPM URL of the server being tested.
@@ -229,7 +242,7 @@ class ServerSettings(FeatureSettings):
         :rtype: str
 
         """
-        return urljoin(self.get_pub_url(), 'katello-ca-consumer-latest.noarch.rpm')
+        return _build_pub_url(self.hostname, 'katello-ca-consumer-latest.noarch.rpm')
 
 
 class BugzillaSettings(FeatureSettings):
@@ -1413,8 +1426,13 @@ class Settings(object):
         self._read_robottelo_settings()
         self._validation_errors.extend(self._validate_robottelo_settings())
 
-        attrs = map(lambda attr_name: (attr_name, getattr(self, attr_name)), dir(self))
-        feature_settings = filter(lambda tpl: isinstance(tpl[1], FeatureSettings), attrs)
+        # Feature settings are instance attributes, there is no need to resolve
+        # every class attribute and property through dir() and getattr()
+        feature_settings = (
+            (name, value)
+            for name, value in sorted(vars(self).items())
+            if isinstance(value, FeatureSettings)
+        )
         for name, settings in feature_settings:
             if self.reader.has_section(name) or name == 'server':
                 settings.read(self.reader)
@@ -1544,20 +1562,25 @@ class Settings(object):
             ``robottelo.entity_mixins.Entity`` for more information on the effects
             of this.
         * Set a default value for ``nailgun.entities.GPGKey.content``.
+        * Disable urllib3's ``InsecureRequestWarning`` as the server
+            certificate is not verified, otherwise a warning is issued for
+            every API request.
         """
         entity_mixins.CREATE_MISSING = True
         entity_mixins.DEFAULT_SERVER_CONFIG = ServerConfig(
             self.server.get_url(), self.server.get_credentials(), verify=False
         )
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
         gpgkey_init = entities.GPGKey.__init__
+        gpgkey_content = os.path.join(
+            get_project_root(), 'tests', 'foreman', 'data', 'valid_gpg_key.txt'
+        )
 
         def patched_gpgkey_init(self, server_config=None, **kwargs):
             """Set a default value on the ``content`` field."""
             gpgkey_init(self, server_config, **kwargs)
-            self._fields['content'].default = os.path.join(
-                get_project_root(), 'tests', 'foreman', 'data', 'valid_gpg_key.txt'
-            )
+            self._fields['content'].default = gpgkey_content
 
         entities.GPGKey.__init__ = patched_gpgkey_init
 
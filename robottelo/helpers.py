@@ -1,6 +1,7 @@
 # -*- encoding: utf-8 -*-
 """Several helper methods and functions."""
 import contextlib
+import functools
 import logging
 import os
 import random
@@ -10,6 +11,8 @@ from urllib.parse import urljoin  # noqa
 
 import requests
 from nailgun.config import ServerConfig
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from robottelo import ssh
 from robottelo.cli.base import CLIReturnCodeError
@@ -22,6 +25,9 @@ from robottelo.errors import GCECertNotFoundError
 
 LOGGER = logging.getLogger(__name__)
 
+# Characters escaped by ``escape_search``
+_SEARCH_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
 
 class DataFileError(Exception):
     """Indicates any issue when reading a data file."""
@@ -49,6 +55,23 @@ class DownloadFileError(Exception):
     """Indicates an error when failure in downloading file from server."""
 
 
+@functools.lru_cache(maxsize=1)
+def get_http_session():
+    """Return the ``requests.Session`` shared by the robottelo HTTP helpers.
+
+    It is used for file and manifest downloads and for polling pulp tasks.
+    The session keeps the connections alive between requests and retries
+    failed connections with a small backoff.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16, pool_maxsize=64, max_retries=Retry(total=3, backoff_factor=0.2)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class ServerFileDownloader(object):
     """Downloads file from given fileurl to local /temp dirctory."""
 
@@ -70,7 +93,7 @@ class ServerFileDownloader(object):
         if not self.file_downloaded:  # pragma: no cover
             self.fd, self.file_path = mkstemp(suffix='.{}'.format(extention))
             fileobj = os.fdopen(self.fd, 'wb')
-            fileobj.write(requests.get(fileurl).content)
+            fileobj.write(get_http_session().get(fileurl).content)
             fileobj.close()
             if os.path.exists(self.file_path):
                 self.file_downloaded = True
@@ -105,7 +128,7 @@ def file_downloader(file_url, local_path=None, file_name=None, hostname=None):
     # download on localhost
     if hostname is None:
         with open('{}{}'.format(local_path, file_name), 'wb') as fileobj:
-            r = requests.get(file_url)
+            r = get_http_session().get(file_url)
             r.raise_for_status()
             fileobj.write(r.content)
             fileobj.close()
@@ -121,9 +144,13 @@ def file_downloader(file_url, local_path=None, file_name=None, hostname=None):
     return ['{}{}'.format(local_path, file_name), file_name]
 
 
+@functools.lru_cache(maxsize=1)
 def get_server_software():
     """Figure out which product distribution is installed on the server.
 
+    The result is cached as the distribution does not change during a test
+    session, use ``get_server_software.cache_clear()`` to check it again.
+
     :return: Either 'upstream' or 'downstream'.
     :rtype: str
 
@@ -192,8 +219,7 @@ def get_nailgun_config(user=None):
 
 def escape_search(term):
     """Wraps a search term in " and escape term's " and \\ characters"""
-    strip_term = term.strip()
-    return '"%s"' % strip_term.replace('\\', '\\\\').replace('"', '\\"')
+    return '"%s"' % term.strip().translate(_SEARCH_ESCAPES)
 
 
 def update_dictionary(default, updates):
@@ -210,7 +236,7 @@ def update_dictionary(default, updates):
     """
 
     if updates:
-        for key in set(default.keys()).intersection(set(updates.keys())):
+        for key in default.keys() & updates.keys():
             default[key] = updates[key]
 
     return default
@@ -349,7 +375,7 @@ def get_available_capsule_port(port_pool=None):
     """
     if port_pool is None:
         port_pool_range = settings.fake_capsules.port_range
-        if type(port_pool_range) is tuple and len(port_pool_range) == 2:
+        if isinstance(port_pool_range, tuple) and len(port_pool_range) == 2:
             port_pool = range(int(port_pool_range[0]), int(port_pool_range[1]))
         else:
             raise TypeError(
@@ -368,11 +394,9 @@ def get_available_capsule_port(port_pool=None):
         raise CapsuleTunnelError(
             'Failed to create ssh tunnel: Error getting port status: {0}'.format(fuser_cmd.stderr)
         )
-    # converts a List of strings to a List of integers
+    # converts a List of strings to a Set of integers
     try:
-        print(fuser_cmd)
-        used_ports = map(int, [val for val in fuser_cmd.stdout[:-1] if val != 'Cannot stat file '])
-
+        used_ports = {int(val) for val in fuser_cmd.stdout[:-1] if val != 'Cannot stat file '}
     except ValueError:
         raise CapsuleTunnelError(
             'Failed parsing the port numbers from stdout: {0}'.format(fuser_cmd.stdout[:-1])
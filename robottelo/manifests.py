@@ -5,7 +5,6 @@ import time
 import uuid
 import zipfile
 
-import requests
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives import serialization
@@ -17,6 +16,7 @@ from robottelo.config import settings
 from robottelo.constants import INTERFACE_API
 from robottelo.constants import INTERFACE_CLI
 from robottelo.decorators.func_locker import lock_function
+from robottelo.helpers import get_http_session
 from robottelo.ssh import upload_file
 
 
@@ -32,9 +32,9 @@ class ManifestCloner(object):
         """Download and cache the manifest information."""
         if self.template is None:
             self.template = {}
-        self.template[name] = requests.get(settings.fake_manifest.url[name]).content
+        self.template[name] = get_http_session().get(settings.fake_manifest.url[name]).content
         if self.signing_key is None:
-            self.signing_key = requests.get(settings.fake_manifest.key_url).content
+            self.signing_key = get_http_session().get(settings.fake_manifest.key_url).content
         if self.private_key is None:
             self.private_key = serialization.load_pem_private_key(
                 self.signing_key, password=None, backend=default_backend()
@@ -85,13 +85,12 @@ class ManifestCloner(object):
 
         # Generate a new manifest.zip file with the generated
         # consumer_export.zip and new signature.
+        consumer_export_data = consumer_export.getvalue()
         manifest = io.BytesIO()
         with zipfile.ZipFile(manifest, 'w', zipfile.ZIP_DEFLATED) as manifest_zip:
-            consumer_export.seek(0)
-            manifest_zip.writestr('consumer_export.zip', consumer_export.read())
-            consumer_export.seek(0)
+            manifest_zip.writestr('consumer_export.zip', consumer_export_data)
             signature = self.private_key.sign(
-                consumer_export.read(), padding.PKCS1v15(), hashes.SHA256()
+                consumer_export_data, padding.PKCS1v15(), hashes.SHA256()
             )
             manifest_zip.writestr('signature', signature)
         # Make sure that the file-like object is at the beginning and
@@ -132,6 +131,8 @@ class Manifest(object):
             # my fancy stuff
     """
 
+    __slots__ = ('_content', 'filename')
+
     def __init__(self, content=None, filename=None, org_environment_access=False, name='default'):
         self._content = content
         self.filename = filename
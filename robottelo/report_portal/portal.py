@@ -140,7 +140,7 @@ class ReportPortal:
         """
         launches_ = self.launches(sat_version=sat_version, launch_type=launch_type)
         if snap_version:
-            if snap_version not in launches_.keys():
+            if snap_version not in launches_:
                 raise ValueError(
                     f'The given snap_version \'{snap_version}\' is not available '
                     f'in satellite version \'{sat_version}\''
@@ -3,7 +3,6 @@ import base64
 import logging
 import os
 import re
-import time
 from contextlib import contextmanager
 from fnmatch import fnmatch
 
@@ -14,6 +13,9 @@ from robottelo.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Escape codes for colors displayed in the commands output
+_COLOR_CODE_REGEX = re.compile(r'\x1b\[\d\d?m')
+
 
 class SSHCommandTimeoutError(Exception):
     """Raised when the SSH command has not finished executing after a
@@ -34,6 +36,8 @@ def decode_to_utf8(text):  # pragma: no cover
 class SSHCommandResult(object):
     """Structure that returns in all ssh commands results."""
 
+    __slots__ = ('stdout', 'stderr', 'return_code', 'output_format')
+
     def __init__(self, stdout=None, stderr=None, return_code=0, output_format=None):
         self.stdout = stdout
         self.stderr = stderr
@@ -51,7 +55,7 @@ class SSHCommandResult(object):
             'SSHCommandResult(stdout={stdout!r}, stderr={stderr!r}, '
             + 'return_code={return_code!r}, output_format={output_format!r})'
         )
-        return tmpl.format(**self.__dict__)
+        return tmpl.format(**{name: getattr(self, name) for name in self.__slots__})
 
 
 class SSHClient(paramiko.SSHClient):
@@ -405,13 +409,9 @@ def execute_command(cmd, connection, output_format=None, timeout=None, connectio
     logger.info('>>> %s', cmd)
     _, stdout, stderr = connection.exec_command(cmd, timeout=connection_timeout)
     if timeout:
-        # wait for the exit status ready
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            if stdout.channel.exit_status_ready():
-                break
-            time.sleep(1)
-        else:
+        # wait for the exit status ready, the channel sets the status event as
+        # soon as the exit status is received
+        if not stdout.channel.status_event.wait(timeout):
             logger.error(
                 'ssh command did not respond in the predefined time'
                 ' (timeout=%s) and will be interrupted',
@@ -430,15 +430,16 @@ def execute_command(cmd, connection, output_format=None, timeout=None, connectio
 
     stdout = stdout.read()
     stderr = stderr.read()
-    # Remove escape code for colors displayed in the output
-    regex = re.compile(r'\x1b\[\d\d?m')
+    # Remove escape code for colors displayed in the output, the bound method
+    # is looked up once instead of once per output line
+    remove_colors = _COLOR_CODE_REGEX.sub
     if stdout:
         # Convert to unicode string
         stdout = decode_to_utf8(stdout)
         logger.info('<<< stdout\n%s', stdout)
     if stderr:
         # Convert to unicode string and remove all color codes characters
-        stderr = regex.sub('', decode_to_utf8(stderr))
+        stderr = remove_colors('', decode_to_utf8(stderr))
         logger.info('<<< stderr\n%s', stderr)
     # Skip converting to list if 'plain', or the hammer options 'json' or 'base' are passed
     if stdout and output_format not in ('json', 'base', 'plain'):
@@ -448,7 +449,7 @@ def execute_command(cmd, connection, output_format=None, timeout=None, connectio
         # Empty fields are returned as "" which gives us '""'
         stdout = stdout.replace('""', '')
         stdout = ''.join(stdout).split('\n')
-        stdout = [regex.sub('', line) for line in stdout if not line.startswith('[')]
+        stdout = [remove_colors('', line) for line in stdout if not line.startswith('[')]
     return SSHCommandResult(stdout, stderr, errorcode, output_format)
 
 
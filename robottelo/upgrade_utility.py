@@ -120,7 +120,7 @@ def publish_content_view(org=None, repolist=None):
     """
 
     content_view = entities.ContentView(organization=org).create()
-    content_view.repository = repolist if type(repolist) is list else [repolist]
+    content_view.repository = repolist if isinstance(repolist, list) else [repolist]
     content_view = content_view.update(['repository'])
     call_entity_method_with_timeout(content_view.publish, timeout=3400)
     content_view = content_view.read()
@@ -0,0 +1,18 @@
+"""Utilities shared across robottelo that do not depend on its other modules."""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """Deserialize JSON data using ``orjson`` when it is installed as it is
+    much faster than the standard library ``json`` module.
+
+    :param data: A ``str`` or ``bytes`` JSON document.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,12 +1,230 @@
 """Unit tests for :mod:`robottelo.api.utils`."""
+import threading
+from unittest import mock
+
+import pytest
+
 from robottelo.api import utils
 
 
+def _stub_foreman_tasks(entities, poll):
+    """Make ``entities.ForemanTask(id=task_id).poll()`` return ``poll(task_id)``."""
+    entities.ForemanTask.side_effect = lambda id: mock.Mock(
+        poll=mock.Mock(side_effect=lambda **kwargs: poll(id))
+    )
+
+
 def test_one_to_one_names():
     """Test :func:`robottelo.api.utils.one_to_one_names`."""
     assert utils.one_to_one_names('person') == {'person_name', 'person_id'}
 
 
+def test_pluck_ids():
+    """Test :func:`robottelo.api.utils.pluck_ids`."""
+    assert utils.pluck_ids([{'id': 1, 'name': 'a'}, {'id': 2}]) == [1, 2]
+    assert utils.pluck_ids([{'task_id': 3}], key='task_id') == [3]
+
+
 def test_one_to_many_names():
     """Test :func:`robottelo.api.utils.one_to_many_names`."""
     assert utils.one_to_many_names('person') == {'person', 'person_ids', 'people'}
+
+
+@pytest.mark.parametrize(
+    'helper, method_name',
+    [(utils.publish_content_views, 'publish'), (utils.sync_repositories, 'sync')],
+)
+@mock.patch('robottelo.api.utils.entities')
+def test_submit_tasks_helpers(entities, helper, method_name):
+    """Test :func:`robottelo.api.utils.publish_content_views` and
+    :func:`robottelo.api.utils.sync_repositories`.
+    """
+    entities_ = [mock.Mock(), mock.Mock()]
+    for task_id, entity in enumerate(entities_):
+        getattr(entity, method_name).return_value = {'id': task_id}
+    _stub_foreman_tasks(entities, lambda task_id: {'id': task_id, 'result': 'success'})
+    assert helper(entities_, timeout=10) == [
+        {'id': 0, 'result': 'success'},
+        {'id': 1, 'result': 'success'},
+    ]
+    for entity in entities_:
+        getattr(entity, method_name).assert_called_once_with(synchronous=False)
+
+
+@mock.patch('robottelo.api.utils.get_repository_set')
+@mock.patch('robottelo.api.utils.get_product_index')
+@mock.patch('robottelo.api.utils.entities')
+def test_enable_rhrepos_and_fetchids(entities, get_product_index, get_repository_set):
+    """Test :func:`robottelo.api.utils.enable_rhrepos_and_fetchids`."""
+    get_product_index.return_value = {'RHEL': mock.Mock(id=10)}
+    enable = get_repository_set.return_value.enable
+    enable.side_effect = [{'id': 'task-1'}, {'id': 'task-2'}]
+    _stub_foreman_tasks(entities, lambda task_id: {'id': task_id})
+    entities.Repository.return_value.search_json.side_effect = [
+        {'results': [{'id': 1}]},
+        {'results': [{'id': 2}]},
+    ]
+    rh_repos = [
+        {'product': 'RHEL', 'reposet': 'RHEL 7', 'name': 'RHEL 7 x86_64', 'basearch': 'x86_64'},
+        {'product': 'RHEL', 'reposet': 'Tools', 'name': 'Tools x86_64', 'releasever': '7'},
+    ]
+    assert utils.enable_rhrepos_and_fetchids(1, rh_repos) == [1, 2]
+    assert enable.call_args_list == [
+        mock.call(data={'basearch': 'x86_64', 'product_id': 10}, synchronous=False),
+        mock.call(data={'releasever': '7', 'product_id': 10}, synchronous=False),
+    ]
+    entities.ForemanTask.assert_has_calls(
+        [mock.call(id='task-1'), mock.call(id='task-2')], any_order=True
+    )
+
+
+def test_bulk_read():
+    """Test :func:`robottelo.api.utils.bulk_read`."""
+    entities_ = [mock.Mock(), mock.Mock(), mock.Mock()]
+    for index, entity in enumerate(entities_):
+        entity.read.return_value = index
+    assert utils.bulk_read(entities_, max_workers=2) == [0, 1, 2]
+    assert utils.bulk_read([]) == []
+
+
+@mock.patch('robottelo.api.utils.get_product_index')
+@mock.patch('robottelo.api.utils.entities')
+def test_enable_rhrepo_and_fetchid_product_not_found(entities, get_product_index):
+    """:func:`robottelo.api.utils.enable_rhrepo_and_fetchid` fails once the
+    refreshed product index does not have the product either.
+    """
+    entities.APIResponseError = LookupError
+    get_product_index.return_value = {}
+    with pytest.raises(LookupError, match='product "RHEL" not found'):
+        utils.enable_rhrepo_and_fetchid('x86_64', 1, 'RHEL', 'RHEL 7', 'RHEL 7 reposet', None)
+    assert get_product_index.call_args_list == [
+        mock.call(1, refresh=False),
+        mock.call(1, refresh=True),
+    ]
+    assert not entities.Product.called
+
+
+@mock.patch('robottelo.api.utils.get_repository_set')
+@mock.patch('robottelo.api.utils.get_product_index')
+@mock.patch('robottelo.api.utils.entities')
+def test_enable_rhrepo_and_fetchid_stale_product(entities, get_product_index, get_repository_set):
+    """:func:`robottelo.api.utils.enable_rhrepo_and_fetchid` refreshes the
+    product index when the indexed product has no such repository set.
+    """
+    get_product_index.side_effect = [{'RHEL': mock.Mock(id=10)}, {'RHEL': mock.Mock(id=11)}]
+    r_set = mock.Mock()
+    get_repository_set.side_effect = [IndexError, r_set]
+    entities.Repository.return_value.search_json.return_value = {'results': [{'id': 5}]}
+    assert utils.enable_rhrepo_and_fetchid('x86_64', 1, 'RHEL', 'RHEL 7', 'RHEL 7', None) == 5
+    assert get_repository_set.call_args_list == [mock.call(10, 'RHEL 7'), mock.call(11, 'RHEL 7')]
+    r_set.enable.assert_called_once_with(
+        data={'basearch': 'x86_64', 'product_id': 11}, synchronous=True
+    )
+
+
+def test_poll_tasks_empty():
+    """:func:`robottelo.api.utils.poll_tasks` with no tasks does nothing."""
+    assert utils.poll_tasks([]) == []
+
+
+@mock.patch('robottelo.api.utils.entities')
+def test_upload_manifest_asynchronous(entities):
+    """:func:`robottelo.api.utils.upload_manifest` can skip waiting for the task."""
+    upload = entities.Subscription.return_value.upload
+    upload.return_value = {'id': 'task-id'}
+    task = utils.upload_manifest(1, 'manifest', synchronous=False)
+    assert task == {'id': 'task-id'}
+    upload.assert_called_once_with(
+        data={'organization_id': 1}, files={'content': 'manifest'}, synchronous=False
+    )
+
+
+@mock.patch('robottelo.api.utils.entities')
+def test_promote_timeout(entities):
+    """:func:`robottelo.api.utils.promote` polls the task with the timeout."""
+    version = mock.Mock()
+    version.promote.return_value = {'id': 'task-id'}
+    poll = entities.ForemanTask.return_value.poll
+    assert utils.promote(version, 2, timeout=3600) is poll.return_value
+    version.promote.assert_called_once_with(
+        data={'environment_ids': [2], 'force': False}, synchronous=False
+    )
+    entities.ForemanTask.assert_called_once_with(id='task-id')
+    poll.assert_called_once_with(timeout=3600)
+
+
+def test_search_iter():
+    """:func:`robottelo.api.utils.search_iter` fetches pages until the last one."""
+    entity = mock.Mock()
+    entity.search.side_effect = [[1, 2], [3, 4], [5]]
+    assert list(utils.search_iter(entity, query={'search': 'name=foo'}, page_size=2)) == [
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+    assert entity.search.call_args_list == [
+        mock.call(query={'search': 'name=foo', 'per_page': 2, 'page': page}) for page in (1, 2, 3)
+    ]
+
+
+def test_search_iter_stops_early():
+    """:func:`robottelo.api.utils.search_iter` fetches pages on demand."""
+    entity = mock.Mock()
+    entity.search.side_effect = [[1, 2], [3, 4]]
+    assert next(utils.search_iter(entity, page_size=2)) == 1
+    entity.search.assert_called_once_with(query={'per_page': 2, 'page': 1})
+
+
+def test_search_all():
+    """:func:`robottelo.api.utils.search_all` fetches pages until the last one."""
+    entity = mock.Mock()
+    pages = {1: [1, 2], 2: [3, 4], 3: [5], 4: []}
+    entity.search.side_effect = lambda query: pages[query['page']]
+    assert utils.search_all(entity, page_size=2, max_workers=2) == [1, 2, 3, 4, 5]
+    assert sorted(call[1]['query']['page'] for call in entity.search.call_args_list) == [
+        1,
+        2,
+        3,
+        4,
+    ]
+
+
+@mock.patch('robottelo.api.utils.entities')
+def test_poll_tasks_failure(entities):
+    """:func:`robottelo.api.utils.poll_tasks` raises the error of a failed task."""
+
+    def poll(task_id):
+        if task_id == 2:
+            raise ValueError('task 2 failed')
+        return {'id': task_id}
+
+    _stub_foreman_tasks(entities, poll)
+    assert utils.poll_tasks([0, 1]) == [{'id': 0}, {'id': 1}]
+    with pytest.raises(ValueError, match='task 2 failed'):
+        utils.poll_tasks([0, 1, 2, 3])
+
+
+@mock.patch('robottelo.api.utils.entities')
+def test_poll_tasks_failure_does_not_wait(entities):
+    """:func:`robottelo.api.utils.poll_tasks` reports a failed task without
+    waiting for the other polls to finish.
+    """
+    release = threading.Event()
+    finished = threading.Event()
+
+    def poll(task_id):
+        if task_id == 1:
+            raise ValueError('task 1 failed')
+        release.wait(5)
+        finished.set()
+        return {'id': task_id}
+
+    _stub_foreman_tasks(entities, poll)
+    try:
+        with pytest.raises(ValueError, match='task 1 failed'):
+            utils.poll_tasks([0, 1])
+        assert not finished.is_set()
+    finally:
+        release.set()
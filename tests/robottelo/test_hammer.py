@@ -1,7 +1,18 @@
 """Tests for Robottelo's hammer helpers"""
+from unittest import mock
+
 from robottelo.cli import hammer
 
 
+def test_normalize():
+    """Header names are normalized to lower case dashed keys, and cached"""
+    assert hammer._normalize('Content Host Count') == 'content-host-count'
+    hits = hammer._normalize.cache_info().hits
+    assert hammer._normalize('Content Host Count') == 'content-host-count'
+    assert hammer._normalize.cache_info().hits == hits + 1
+    assert hammer._normalize('ID') == 'id'
+
+
 class TestParseCSV:
     """Tests for parsing CSV hammer output"""
 
@@ -82,6 +93,14 @@ class TestParseJSON:
             'name': 'Default Organization View',
         }
 
+    def test_parse_json_without_orjson(self):
+        """The standard library json module is used when orjson is missing"""
+        with mock.patch('robottelo.utils.orjson', None):
+            assert hammer.parse_json('{"ID": 1, "Name": "Library"}') == {
+                'id': '1',
+                'name': 'Library',
+            }
+
     def test_parsed_json_match_parsed_csv(self):
         """ Output generated by:
         JSON:
@@ -526,3 +545,19 @@ class TestParseInfo:
     def test_parse_json_list(self):
         """Can parse a list in json"""
         assert hammer.parse_json('["item1", "item2"]') == ['item1', 'item2']
+
+    def test_parse_json_list_of_records(self):
+        """Can parse a list of records with different keys in json"""
+        output = """[
+          {"ID": 1, "Name": "rec1", "Sub Items": [{"Item ID": 2}]},
+          {"ID": 3, "Name": "rec2", "Sub Items": []},
+          {"ID": 4, "Other Name": "rec3"},
+          "item"
+        ]
+        """
+        assert hammer.parse_json(output) == [
+            {'id': '1', 'name': 'rec1', 'sub-items': [{'item-id': '2'}]},
+            {'id': '3', 'name': 'rec2', 'sub-items': []},
+            {'id': '4', 'other-name': 'rec3'},
+            'item',
+        ]
@@ -3,7 +3,9 @@ from unittest import mock
 
 import pytest
 
+from robottelo.cli.proxy import CapsuleTunnelError
 from robottelo.helpers import escape_search
+from robottelo.helpers import get_available_capsule_port
 from robottelo.helpers import get_host_info
 from robottelo.helpers import get_server_version
 from robottelo.helpers import HostInfoError
@@ -72,6 +74,28 @@ class TestGetHostInfo:
             get_host_info()
 
 
+class TestGetAvailableCapsulePort:
+    """Tests for method ``get_available_capsule_port``."""
+
+    @mock.patch('robottelo.helpers.ssh')
+    def test_skips_used_ports(self, ssh):
+        ssh.command = mock.MagicMock(return_value=FakeSSHResult(['9091', '9092', ''], 0))
+        for _ in range(5):
+            assert get_available_capsule_port(range(9091, 9094)) == 9093
+
+    @mock.patch('robottelo.helpers.ssh')
+    def test_no_ports_available(self, ssh):
+        ssh.command = mock.MagicMock(return_value=FakeSSHResult(['9091', '9092', ''], 0))
+        with pytest.raises(CapsuleTunnelError, match=r'.*No more ports available.*'):
+            get_available_capsule_port(range(9091, 9093))
+
+    @mock.patch('robottelo.helpers.ssh')
+    def test_port_parse_fail(self, ssh):
+        ssh.command = mock.MagicMock(return_value=FakeSSHResult(['not-a-port', ''], 0))
+        with pytest.raises(CapsuleTunnelError, match=r'.*Failed parsing the port numbers.*'):
+            get_available_capsule_port(range(9091, 9093))
+
+
 class TestEscapeSearch:
     def test_return_type(self):
         """Tests if escape search returns a unicode string"""
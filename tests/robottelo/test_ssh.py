@@ -1,5 +1,6 @@
 """Tests for module ``robottelo.ssh``."""
 import os
+import threading
 from unittest import mock
 
 import paramiko
@@ -12,6 +13,13 @@ class MockChannel(object):
     def __init__(self, ret, status_ready=True):
         self.ret = ret
         self.status_ready = status_ready
+        self.status_event = threading.Event()
+        if status_ready:
+            self.status_event.set()
+        self.closed = False
+
+    def close(self):
+        self.closed = True
 
     def recv_exit_status(self):
         return self.ret
@@ -21,9 +29,9 @@ class MockChannel(object):
 
 
 class MockStdout(object):
-    def __init__(self, cmd, ret):
+    def __init__(self, cmd, ret, status_ready=True):
         self.cmd = cmd
-        self.channel = MockChannel(ret=ret)
+        self.channel = MockChannel(ret=ret, status_ready=status_ready)
 
     def read(self):
         return self.cmd
@@ -240,6 +248,19 @@ class TestSSH:
             assert ret.stdout == ['ls -la']
             assert isinstance(ret, ssh.SSHCommandResult)
 
+    def test_execute_command_timeout(self):
+        """The channels are closed when the exit status is not received in
+        time.
+        """
+        stdout = MockStdout('sleep 10', 0, status_ready=False)
+        stderr = MockStdout('', 0, status_ready=False)
+        connection = mock.Mock()
+        connection.exec_command.return_value = (None, stdout, stderr)
+        with pytest.raises(ssh.SSHCommandTimeoutError):
+            ssh.execute_command('sleep 10', connection, timeout=0.01, connection_timeout=10)
+        assert stdout.channel.closed
+        assert stderr.channel.closed
+
     @mock.patch('robottelo.ssh.settings')
     def test_execute_command_base_output(self, settings):
         ssh._call_paramiko_sshclient = MockSSHClient